@@ -1,14 +1,23 @@
 import os
+import errno
 import shutil
 import time
+import struct
 import json
+import signal
 import logging
 import argparse
-from datetime import datetime
+import threading
+import queue
+import sqlite3
+import multiprocessing
+from concurrent.futures import (ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from PIL import Image
-from PIL.ExifTags import TAGS
 import piexif
 import ffmpeg
 
@@ -22,77 +31,736 @@ logging.basicConfig(
 )
 logger = logging.getLogger('photo-organizer')
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# ioctl request to clone a file's extents (Linux FICLONE)
+FICLONE = 0x40049409
+
+# Errors meaning a hardlink or reflink is not possible for this file pair,
+# in which case the file is copied instead
+LINK_FALLBACK_ERRNOS = frozenset([
+    errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EINVAL,
+    errno.ENOTTY, errno.ENOSYS, errno.EOPNOTSUPP,
+])
+
+# EXIF data lives in the APP1 segment at the start of a JPEG, so reading the
+# first 64 KB is enough for almost every file.
+JPEG_EXIF_READ_SIZE = 64 * 1024
+
+# MP4/QuickTime timestamps count seconds since 1904-01-01 UTC
+MP4_EPOCH = datetime(1904, 1, 1)
+
+# Files sent to a date extraction process at a time when scanning
+DATE_BATCH_SIZE = 32
+# Batches in flight per process. Together with SCANDIR_QUEUE_SIZE this
+# bounds memory use while the rest of the tree is still being scanned.
+DATE_BATCHES_PER_PROCESS = 4
+# Directory listings the scanning threads may queue ahead of the consumer
+# before they block
+SCANDIR_QUEUE_SIZE = 64
+# Default upper limit of date extraction processes. os.cpu_count() reports
+# the host's CPUs, not the container's CPU limit.
+DEFAULT_MAX_PROCESSES = 4
+
+def get_file_ext(file_path):
+    """
+    Return the lowercased extension of a file path, including the dot, or an
+    empty string if the file name has none. Cheaper than os.path.splitext,
+    which parses the whole path.
+    """
+    dot = file_path.rfind('.')
+    sep = file_path.rfind(os.sep)
+    if os.altsep:
+        sep = max(sep, file_path.rfind(os.altsep))
+    if dot <= sep:
+        return ''
+    return file_path[dot:].lower()
+
+def _parse_exif_datetime(date_str):
+    """
+    Parse an EXIF 'YYYY:MM:DD HH:MM:SS' timestamp into a datetime object.
+    The fields sit at fixed offsets, so they are sliced out directly;
+    anything else goes through strptime.
+    """
+    if len(date_str) == 19:
+        try:
+            return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                            int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]))
+        except ValueError:
+            pass
+    return datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
+
+def _find_ifd_entry(tiff, endian, ifd_offset, tag_id):
+    """
+    Scan the 12-byte entries of a TIFF IFD for a tag.
+    Returns the (count, value/offset) pair of the entry, or None.
+    """
+    entry_count = struct.unpack_from(endian + 'H', tiff, ifd_offset)[0]
+    for i in range(entry_count):
+        tag, _, count, value = struct.unpack_from(endian + 'HHII', tiff, ifd_offset + 2 + i * 12)
+        if tag == tag_id:
+            return count, value
+    return None
+
+def _fast_jpeg_datetime(data):
+    """
+    Read DateTimeOriginal (or DateTime) straight from the EXIF APP1 segment
+    of the given JPEG data, without a general-purpose EXIF parser.
+    Returns a datetime object or None if the date cannot be found this way.
+    """
+    if data[:2] != b'\xff\xd8':
+        return None
+
+    # Walk the segment markers until the EXIF APP1 segment
+    offset = 2
+    while True:
+        if offset + 4 > len(data) or data[offset] != 0xff:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xda:
+            # Start of scan: no more metadata segments
+            return None
+        length = struct.unpack_from('>H', data, offset + 2)[0]
+        if marker == 0xe1 and data[offset + 4:offset + 10] == b'Exif\x00\x00':
+            tiff = data[offset + 10:offset + 2 + length]
+            break
+        offset += 2 + length
+
+    if tiff[:2] == b'II':
+        endian = '<'
+    elif tiff[:2] == b'MM':
+        endian = '>'
+    else:
+        return None
+
+    try:
+        ifd0_offset = struct.unpack_from(endian + 'I', tiff, 4)[0]
+        entry = None
+        # DateTimeOriginal (0x9003) lives in the Exif sub-IFD (0x8769)
+        exif_ifd = _find_ifd_entry(tiff, endian, ifd0_offset, 0x8769)
+        if exif_ifd:
+            entry = _find_ifd_entry(tiff, endian, exif_ifd[1], 0x9003)
+        if not entry:
+            # Fall back to DateTime (0x0132) in IFD0
+            entry = _find_ifd_entry(tiff, endian, ifd0_offset, 0x0132)
+        if not entry or entry[0] < 20:
+            return None
+        date_str = tiff[entry[1]:entry[1] + 19].decode('ascii')
+        return _parse_exif_datetime(date_str)
+    except (struct.error, ValueError):
+        return None
+
+def _get_jpeg_date(file_path):
+    """
+    Extract the EXIF date of a JPEG file using only the start of the file.
+    Tries the fast APP1 parser first, then piexif. piexif reads the file
+    itself if the EXIF segment does not fit in the first chunk.
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(JPEG_EXIF_READ_SIZE)
+    # piexif treats data without a JPEG signature as a file name, so never
+    # hand it anything else
+    if head[:2] != b'\xff\xd8':
+        raise piexif.InvalidImageDataError("File is not a JPEG")
+    file_date = _fast_jpeg_datetime(head)
+    if file_date:
+        return file_date
+    try:
+        exif_dict = piexif.load(head)
+    except (piexif.InvalidImageDataError, struct.error, ValueError):
+        exif_dict = piexif.load(file_path)
+    return _get_exif_date(exif_dict)
+
+def _find_mp4_box(f, box_type, end):
+    """
+    Scan the sibling boxes from the current position of an MP4/QuickTime
+    file up to the given end offset for a box of the given type.
+    Returns the (payload_start, box_end) offsets, or None if not found.
+    """
+    while f.tell() + 8 <= end:
+        box_start = f.tell()
+        size, kind = struct.unpack('>I4s', f.read(8))
+        if size == 1:
+            # 64-bit box size follows the type
+            size = struct.unpack('>Q', f.read(8))[0]
+        elif size == 0:
+            # Box extends to the end of its parent
+            size = end - box_start
+        if size < f.tell() - box_start:
+            return None
+        if kind == box_type:
+            return f.tell(), box_start + size
+        f.seek(box_start + size)
+    return None
+
+def _fast_mp4_datetime(file_path):
+    """
+    Read the creation time from the moov/mvhd box of an MP4/QuickTime file.
+    Returns a datetime object (UTC) or None if the date cannot be found.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            moov = _find_mp4_box(f, b'moov', file_size)
+            if not moov:
+                return None
+            f.seek(moov[0])
+            mvhd = _find_mp4_box(f, b'mvhd', moov[1])
+            if not mvhd:
+                return None
+            f.seek(mvhd[0])
+            version = f.read(4)[0]
+            if version == 1:
+                creation_time = struct.unpack('>Q', f.read(8))[0]
+            else:
+                creation_time = struct.unpack('>I', f.read(4))[0]
+    except (struct.error, IndexError):
+        return None
+    if not creation_time:
+        return None
+    try:
+        return MP4_EPOCH + timedelta(seconds=creation_time)
+    except OverflowError:
+        return None
+
+def _load_pil_exif(file_path):
+    """
+    Load EXIF data with PIL, in the same layout as returned by piexif.load.
+    """
+    with Image.open(file_path) as img:
+        exif = img.getexif()
+        return {'0th': dict(exif), 'Exif': dict(exif.get_ifd(0x8769))}
+
+def _get_exif_date(exif_dict):
+    """
+    Return the DateTimeOriginal or DateTime value of an EXIF dictionary
+    as a datetime object, or None if neither tag is present.
+    """
+    # Look for DateTimeOriginal tag (36867) or DateTime tag (306)
+    for ifd, tag_id in [('Exif', piexif.ExifIFD.DateTimeOriginal),
+                        ('0th', piexif.ImageIFD.DateTime)]:
+        date_str = exif_dict.get(ifd, {}).get(tag_id)
+        if date_str:
+            if isinstance(date_str, bytes):
+                date_str = date_str.decode('ascii')
+            return _parse_exif_datetime(date_str.rstrip('\x00'))
+    return None
+
+def _get_piexif_date(file_path):
+    """
+    Extract the EXIF date of a TIFF file with piexif.
+    """
+    return _get_exif_date(piexif.load(file_path))
+
+def _get_pil_date(file_path):
+    """
+    Extract the EXIF date of an image format piexif cannot parse (HEIC),
+    using PIL.
+    """
+    return _get_exif_date(_load_pil_exif(file_path))
+
+def _get_ffprobe_date(file_path):
+    """
+    Extract the creation time of a video file with ffprobe.
+    """
+    probe = ffmpeg.probe(file_path)
+    if 'creation_time' in probe['format']['tags']:
+        date_str = probe['format']['tags']['creation_time']
+        return datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S.%fZ')
+    return None
+
+def _get_mp4_date(file_path):
+    """
+    Extract the creation time of an MP4/QuickTime file from its mvhd box,
+    falling back to ffprobe.
+    """
+    return _fast_mp4_datetime(file_path) or _get_ffprobe_date(file_path)
+
+# Extension -> function reading the date from the file's metadata, so each
+# file is classified with a single dict lookup. PNG, GIF, BMP and WebP files
+# almost never carry an EXIF date, so they have no reader and go straight to
+# the modification time.
+DATE_READERS = {
+    **dict.fromkeys(['.jpg', '.jpeg'], _get_jpeg_date),
+    '.tiff': _get_piexif_date,
+    '.heic': _get_pil_date,
+    **dict.fromkeys(['.mp4', '.mov', '.m4v'], _get_mp4_date),
+    **dict.fromkeys(['.avi', '.mkv', '.webm', '.mpg'], _get_ffprobe_date),
+}
+
+def read_file_date(file_path, file_ext, file_stat=None):
+    """
+    Extract date from file using EXIF data or file metadata.
+    file_ext is the file's extension as returned by get_file_ext, and
+    file_stat its stat result, if it is already known.
+    This does not depend on any organizer state, so it can run in a
+    separate process.
+    Returns a datetime object or None if date cannot be extracted.
+    """
+    date_reader = DATE_READERS.get(file_ext)
+    if date_reader:
+        try:
+            file_date = date_reader(file_path)
+            if file_date:
+                return file_date
+        except Exception as e:
+            logger.warning("Could not extract metadata from %s: %s", file_path, e)
+    
+    # Fallback to file modification time
+    if file_stat is None:
+        file_stat = os.stat(file_path)
+    return datetime.fromtimestamp(file_stat.st_mtime)
+
+def _read_file_date_or_error(file_path):
+    """
+    Wrapper around read_file_date that returns the exception instead of
+    raising it, so that one unreadable file does not abort the whole batch.
+    """
+    try:
+        return read_file_date(file_path, get_file_ext(file_path))
+    except Exception as e:
+        return e
+
+def _read_file_dates(file_paths):
+    """
+    Process pool task extracting the dates of a batch of files.
+    Returns a list with the date, or the exception raised, for each file.
+    """
+    return [_read_file_date_or_error(file_path) for file_path in file_paths]
+
+def _available_cpus():
+    """
+    Return the number of CPUs this process may run on.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def _process_pool_context():
+    """
+    Return the multiprocessing context for date extraction processes.
+    Worker processes are started while scanning and copying threads are
+    running, and forking a process with live threads can deadlock on locks
+    they hold, so they are started from a forkserver where available.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return None
+
+def parallel_scandir(root, extensions, workers=16):
+    """
+    Recursively scan a directory with several threads and yield os.DirEntry
+    objects for the files whose extension is in the given set.
+    Each thread lists one directory at a time and pushes its subdirectories
+    back onto a shared LIFO queue, so threads tend to stay within the subtree
+    they just listed. At most SCANDIR_QUEUE_SIZE listings are queued ahead of
+    the consumer.
+    """
+    dirs = queue.LifoQueue()
+    file_batches = queue.Queue(maxsize=SCANDIR_QUEUE_SIZE)
+    cancelled = threading.Event()
+    dirs.put(root)
+
+    def scan():
+        while True:
+            directory = dirs.get()
+            if directory is None:
+                return
+            if cancelled.is_set():
+                dirs.task_done()
+                continue
+            batch = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.put(entry.path)
+                        elif entry.is_file():
+                            if get_file_ext(entry.name) in extensions:
+                                batch.append(entry)
+            except OSError as e:
+                logger.error("Error scanning directory %s: %s", directory, e)
+            finally:
+                if batch:
+                    file_batches.put(batch)
+                dirs.task_done()
+
+    def finish():
+        # Every queued directory has been scanned: stop the scanning threads
+        # and tell the consumer there are no more files
+        dirs.join()
+        for _ in range(workers):
+            dirs.put(None)
+        file_batches.put(None)
+
+    for _ in range(workers):
+        threading.Thread(target=scan, name='scandir', daemon=True).start()
+    threading.Thread(target=finish, name='scandir-finish', daemon=True).start()
+
+    def drain():
+        while file_batches.get() is not None:
+            pass
+
+    try:
+        while True:
+            batch = file_batches.get()
+            if batch is None:
+                return
+            yield from batch
+    except GeneratorExit:
+        # The consumer stopped early: skip the remaining directories and keep
+        # the queue moving so blocked scanning threads can finish
+        cancelled.set()
+        threading.Thread(target=drain, name='scandir-drain', daemon=True).start()
+        raise
+
+class DateCache:
+    """
+    Persistent SQLite cache of file dates, keyed by device, inode,
+    modification time and size, so that the metadata of unchanged files is
+    not parsed again on later runs.
+    """
+    # Inserts are committed in batches of this size
+    COMMIT_BATCH_SIZE = 500
+
+    def __init__(self, db_path):
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS file_dates ('
+            'dev INTEGER, inode INTEGER, mtime_ns INTEGER, size INTEGER, file_date TEXT, '
+            'PRIMARY KEY (dev, inode, mtime_ns, size)) WITHOUT ROWID'
+        )
+        self._conn.commit()
+
+    def get(self, file_stat):
+        """
+        Return the cached date of a file, or None if it is not cached.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT file_date FROM file_dates '
+                'WHERE dev = ? AND inode = ? AND mtime_ns = ? AND size = ?',
+                (file_stat.st_dev, file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def set(self, file_stat, file_date):
+        """
+        Cache the date of a file.
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO file_dates VALUES (?, ?, ?, ?, ?)',
+                (file_stat.st_dev, file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size,
+                 file_date.isoformat())
+            )
+            self._pending += 1
+            if self._pending >= self.COMMIT_BATCH_SIZE:
+                self._conn.commit()
+                self._pending = 0
+
+    def commit(self):
+        """
+        Commit any pending inserts.
+        """
+        with self._lock:
+            self._conn.commit()
+            self._pending = 0
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.commit()
+            finally:
+                self._conn.close()
+
 class PhotoOrganizer:
-    def __init__(self, watch_paths, output_path, dry_run=False):
+    def __init__(self, watch_paths, output_path, dry_run=False, workers=None, link_mode='copy',
+                 processes=None):
         self.watch_paths = watch_paths
         self.output_path = output_path
         self.dry_run = dry_run
+        self.link_mode = link_mode
+        # File handling is dominated by I/O (EXIF reads, ffprobe, copying), so
+        # oversubscribing the CPU count with threads pays off.
+        self.workers = workers or min(32, _available_cpus() * 4)
+        # Metadata parsing for directory scans is spread over processes, as
+        # it is CPU bound for large libraries
+        if processes is None:
+            processes = min(DEFAULT_MAX_PROCESSES, _available_cpus())
+        self.processes = processes
         self.supported_extensions = {
             'images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.heic', '.webp'],
             'videos': ['.mp4', '.mov', '.avi', '.mkv', '.webm', '.mpg', '.m4v']
         }
-        logger.info(f"Photo Organizer initialized with watch paths: {watch_paths}")
-        logger.info(f"Output path: {output_path}")
-        logger.info(f"Dry run mode: {dry_run}")
+        self._image_exts = frozenset(self.supported_extensions['images'])
+        self._video_exts = frozenset(self.supported_extensions['videos'])
+        self._all_exts = self._image_exts | self._video_exts
+        # Destination directories created or listed during the current
+        # directory scan, and the cached file names of each listed directory.
+        # Both are cleared when the scan ends, so the watcher does not act on
+        # stale listings.
+        self._known_dirs = set()
+        self._dir_contents = {}
+        self._dirs_lock = threading.Lock()
+        # Dates extracted on previous runs. Not used in dry run mode, which
+        # must not write to the output directory.
+        self._date_cache = None
+        self._cache_lock = threading.Lock()
+        if not dry_run:
+            try:
+                os.makedirs(output_path, exist_ok=True)
+                self._date_cache = DateCache(os.path.join(output_path, '.organizer-cache.sqlite'))
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Could not open the date cache, dates will not be cached: %s", e)
+        logger.info("Photo Organizer initialized with watch paths: %s", watch_paths)
+        logger.info("Output path: %s", output_path)
+        logger.info("Dry run mode: %s", dry_run)
+        logger.info("Worker threads: %s", self.workers)
+        logger.info("Worker processes for directory scans: %s", self.processes)
+        logger.info("Link mode: %s", link_mode)
+
+    def close(self):
+        """
+        Flush and close the date cache.
+        """
+        date_cache, self._date_cache = self._date_cache, None
+        if date_cache is not None:
+            try:
+                date_cache.close()
+            except sqlite3.Error as e:
+                logger.warning("Could not close the date cache: %s", e)
+
+    def _disable_date_cache(self, error):
+        """
+        Stop using the date cache after it failed, so that a broken cache
+        (locked database, I/O error, unsupported network filesystem) only
+        turns caching off instead of failing every file.
+        """
+        with self._cache_lock:
+            date_cache, self._date_cache = self._date_cache, None
+        if date_cache is None:
+            # Another thread already disabled it
+            return
+        logger.warning("Date cache failed, dates will no longer be cached: %s", error)
+        try:
+            date_cache.close()
+        except sqlite3.Error:
+            pass
+
+    def _get_cached_date(self, file_stat):
+        """
+        Return the cached date of a file, or None if it is not cached.
+        """
+        date_cache = self._date_cache
+        if date_cache is None:
+            return None
+        try:
+            return date_cache.get(file_stat)
+        except sqlite3.Error as e:
+            self._disable_date_cache(e)
+            return None
 
-    def get_file_date(self, file_path):
+    def _cache_date(self, file_stat, file_date):
         """
-        Extract date from file using EXIF data or file metadata.
+        Store the date of a file in the date cache, if it is enabled.
+        """
+        date_cache = self._date_cache
+        if date_cache is None:
+            return
+        try:
+            date_cache.set(file_stat, file_date)
+        except sqlite3.Error as e:
+            self._disable_date_cache(e)
+
+    def commit_date_cache(self):
+        """
+        Commit the dates cached so far, if the date cache is enabled.
+        """
+        date_cache = self._date_cache
+        if date_cache is None:
+            return
+        try:
+            date_cache.commit()
+        except sqlite3.Error as e:
+            self._disable_date_cache(e)
+
+    def is_supported(self, file_path):
+        """
+        Return whether the file has a supported image or video extension.
+        """
+        return get_file_ext(file_path) in self._all_exts
+
+    def get_file_date(self, file_path, file_ext, entry=None):
+        """
+        Extract date from file using EXIF data or file metadata, reusing the
+        date cached for the file on a previous run if it has not changed.
+        file_ext is the file's extension as returned by get_file_ext.
         Returns a datetime object or None if date cannot be extracted.
         """
-        file_ext = os.path.splitext(file_path)[1].lower()
-        
+        file_stat = entry.stat() if entry is not None else os.stat(file_path)
+        file_date = self._get_cached_date(file_stat)
+        if file_date is None:
+            file_date = read_file_date(file_path, file_ext, file_stat)
+            self._cache_date(file_stat, file_date)
+        return file_date
+
+    def _copy_file_range(self, src, dst):
+        """
+        Copy file data with os.copy_file_range, which lets the kernel copy
+        without going through userspace (or share blocks on reflink-capable
+        filesystems). The destination must not exist yet.
+        """
+        src_fd = os.open(src, os.O_RDONLY)
         try:
-            # Handle image files
-            if file_ext in self.supported_extensions['images']:
-                try:
-                    # Try to get EXIF data
-                    with Image.open(file_path) as img:
-                        exif_data = img._getexif()
-                        if exif_data:
-                            # Look for DateTimeOriginal tag (36867) or DateTime tag (306)
-                            for tag_id in [36867, 306]:
-                                if tag_id in exif_data:
-                                    date_str = exif_data[tag_id]
-                                    return datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
-                except Exception as e:
-                    logger.warning(f"Could not extract EXIF data from {file_path}: {e}")
-            
-            # Handle video files
-            elif file_ext in self.supported_extensions['videos']:
-                try:
-                    # Try to get metadata from ffmpeg
-                    probe = ffmpeg.probe(file_path)
-                    if 'creation_time' in probe['format']['tags']:
-                        date_str = probe['format']['tags']['creation_time']
-                        return datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%S.%fZ')
-                except Exception as e:
-                    logger.warning(f"Could not extract video metadata from {file_path}: {e}")
-            
-        except Exception as e:
-            logger.error(f"Error processing file {file_path}: {e}")
-        
-        # Fallback to file modification time
-        file_mtime = os.path.getmtime(file_path)
-        return datetime.fromtimestamp(file_mtime)
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            try:
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if copied == 0:
+                        # Some filesystems report no data copied instead of
+                        # failing; treat that as unsupported
+                        raise OSError(errno.EOPNOTSUPP, "copy_file_range copied no data")
+                    remaining -= copied
+            except BaseException:
+                os.close(dst_fd)
+                os.unlink(dst)
+                raise
+            os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    def _copy(self, src, dst):
+        """
+        Copy a file and its metadata, like shutil.copy2.
+        Uses os.copy_file_range where available, falling back to a regular
+        copy if the kernel or filesystem does not support it. The destination
+        must not exist yet.
+        """
+        if hasattr(os, 'copy_file_range'):
+            try:
+                self._copy_file_range(src, dst)
+                shutil.copystat(src, dst)
+                return
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+        # Create the destination exclusively, like the other placement modes,
+        # so an existing file is never overwritten
+        with open(src, 'rb') as fsrc:
+            try:
+                with open(dst, 'xb') as fdst:
+                    shutil.copyfileobj(fsrc, fdst)
+            except FileExistsError:
+                raise
+            except BaseException:
+                os.unlink(dst)
+                raise
+        shutil.copystat(src, dst)
+
+    def _reflink(self, src, dst):
+        """
+        Clone a file with the FICLONE ioctl so that it shares its data blocks
+        with the source (btrfs, XFS with reflink). The destination must not
+        exist yet.
+        """
+        if fcntl is None:
+            raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported on this platform")
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            except BaseException:
+                os.close(dst_fd)
+                os.unlink(dst)
+                raise
+            os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        shutil.copystat(src, dst)
+
+    def _place_file(self, src, dst):
+        """
+        Place a file at its destination according to the link mode.
+        'hardlink' and 'auto' try a hardlink first, 'reflink' and 'auto' try
+        a reflink; anything that cannot be linked is copied.
+        Returns a description of the action taken, for logging.
+        """
+        if self.link_mode in ('hardlink', 'auto'):
+            try:
+                # os.link does not follow symlinks on Linux, so resolve the
+                # source to link the photo itself rather than the symlink
+                os.link(os.path.realpath(src), dst)
+                return 'Hardlinked'
+            except OSError as e:
+                if e.errno not in LINK_FALLBACK_ERRNOS:
+                    raise
+        if self.link_mode in ('reflink', 'auto'):
+            try:
+                self._reflink(src, dst)
+                return 'Reflinked'
+            except OSError as e:
+                if e.errno not in LINK_FALLBACK_ERRNOS:
+                    raise
+        self._copy(src, dst)
+        return 'Copied'
+
+    def _claim_dest_name(self, dest_dir, filename):
+        """
+        Claim a file name in a destination directory during a directory scan,
+        using a listing of the directory cached for the rest of the scan.
+        Returns the cached set of names, or None if the name is already taken.
+        """
+        contents = self._dir_contents.get(dest_dir)
+        if contents is None:
+            # List outside the lock, so other workers are not held up by a
+            # slow directory listing
+            try:
+                listing = set(os.listdir(dest_dir))
+                dir_exists = True
+            except FileNotFoundError:
+                listing = set()
+                dir_exists = False
+            with self._dirs_lock:
+                contents = self._dir_contents.setdefault(dest_dir, listing)
+                if dir_exists:
+                    self._known_dirs.add(dest_dir)
+        with self._dirs_lock:
+            if filename in contents:
+                return None
+            if not self.dry_run:
+                # Claim the name so other workers do not copy over it
+                contents.add(filename)
+        return contents
 
-    def organize_file(self, file_path):
+    def organize_file(self, file_path, entry=None, file_date=None):
         """
         Organize a single file according to its date.
+        entry is the file's os.DirEntry when it was found by scanning a directory,
+        file_date its date when it has already been extracted.
         """
-        file_ext = os.path.splitext(file_path)[1].lower()
+        file_ext = get_file_ext(file_path)
         
         # Check if file is a supported type
-        all_extensions = self.supported_extensions['images'] + self.supported_extensions['videos']
-        if file_ext not in all_extensions:
-            logger.debug(f"Skipping unsupported file: {file_path}")
+        if file_ext not in self._all_exts:
+            logger.debug("Skipping unsupported file: %s", file_path)
             return
         
         try:
             # Get the file date
-            file_date = self.get_file_date(file_path)
+            if file_date is None:
+                file_date = self.get_file_date(file_path, file_ext, entry)
             if not file_date:
-                logger.warning(f"Could not determine date for {file_path}, skipping")
+                logger.warning("Could not determine date for %s, skipping", file_path)
                 return
             
             # Create destination path: output_path/YYYY/YYYY-MM-DD/
@@ -101,54 +769,250 @@ class PhotoOrganizer:
             dest_dir = os.path.join(self.output_path, year_dir, date_dir)
             
             # Get original filename
-            filename = os.path.basename(file_path)
+            filename = entry.name if entry is not None else os.path.basename(file_path)
             
             # Create the full destination path
             dest_path = os.path.join(dest_dir, filename)
             
-            # Check if destination file already exists
-            if os.path.exists(dest_path):
-                logger.info(f"Skipping file as it already exists at destination: {dest_path}")
+            # Check if destination file already exists. Directory scans list
+            # each destination directory once instead of a stat per file;
+            # files reported by the watcher are checked directly.
+            contents = None
+            if entry is not None:
+                contents = self._claim_dest_name(dest_dir, filename)
+                if contents is None:
+                    logger.info("Skipping file as it already exists at destination: %s", dest_path)
+                    return
+            elif os.path.exists(dest_path):
+                logger.info("Skipping file as it already exists at destination: %s", dest_path)
                 return
             
-            # Create directory if it doesn't exist
-            if not os.path.exists(dest_dir) and not self.dry_run:
-                os.makedirs(dest_dir, exist_ok=True)
-                logger.debug(f"Created directory: {dest_dir}")
-            
             # Copy the file
             if self.dry_run:
-                logger.info(f"DRY RUN: Would copy {file_path} to {dest_path}")
+                logger.info("DRY RUN: Would copy %s to %s", file_path, dest_path)
             else:
-                shutil.copy2(file_path, dest_path)
-                logger.info(f"Copied {file_path} to {dest_path}")
+                try:
+                    # Create directory if it doesn't exist
+                    if dest_dir not in self._known_dirs:
+                        os.makedirs(dest_dir, exist_ok=True)
+                        logger.debug("Created directory: %s", dest_dir)
+                        if contents is not None:
+                            with self._dirs_lock:
+                                self._known_dirs.add(dest_dir)
+                    # Every placement mode refuses to overwrite an existing file
+                    action = self._place_file(file_path, dest_path)
+                except FileExistsError:
+                    logger.info("Skipping file as it already exists at destination: %s", dest_path)
+                    return
+                except Exception:
+                    if contents is not None:
+                        # Release the claimed name so the file is retried later
+                        with self._dirs_lock:
+                            contents.discard(filename)
+                    raise
+                logger.info("%s %s to %s", action, file_path, dest_path)
                 
         except Exception as e:
-            logger.error(f"Error organizing file {file_path}: {e}")
+            logger.error("Error organizing file %s: %s", file_path, e)
+
+    def _organize_dated_batch(self, executor, entries, file_dates):
+        """
+        Cache the dates extracted for a batch of scanned files and dispatch
+        the files to the thread pool.
+        """
+        for entry, file_date in zip(entries, file_dates):
+            if isinstance(file_date, Exception):
+                logger.error("Error organizing file %s: %s", entry.path, file_date)
+                continue
+            if self._date_cache is not None:
+                self._cache_date(entry.stat(), file_date)
+            executor.submit(self.organize_file, entry.path, entry, file_date)
+
+    def _process_entries_with_pool(self, entries, executor, process_executor):
+        """
+        Extract the dates of scanned files in batches in the process pool as
+        the files are found, and dispatch each finished batch to the thread
+        pool. Files with a cached date are dispatched right away.
+        If a worker process dies, the process pool is abandoned and the
+        remaining files have their dates extracted in the worker threads.
+        """
+        max_pending = self.processes * DATE_BATCHES_PER_PROCESS
+        pending = {}
+        batch = []
+        pool_broken = False
+
+        def organize_in_threads(batch_entries):
+            for entry in batch_entries:
+                executor.submit(self.organize_file, entry.path, entry)
+
+        def on_pool_broken(error):
+            nonlocal pool_broken
+            if not pool_broken:
+                logger.error("Date extraction process died, extracting the remaining "
+                             "dates in worker threads instead: %s", error)
+                pool_broken = True
+
+        def submit_batch(batch_entries):
+            if not pool_broken:
+                try:
+                    future = process_executor.submit(
+                        _read_file_dates, [entry.path for entry in batch_entries])
+                    pending[future] = batch_entries
+                    return
+                except BrokenProcessPool as e:
+                    on_pool_broken(e)
+            organize_in_threads(batch_entries)
+
+        def finish_pending(return_when):
+            done, _ = wait(pending, return_when=return_when)
+            for future in done:
+                batch_entries = pending.pop(future)
+                try:
+                    file_dates = future.result()
+                except BrokenProcessPool as e:
+                    on_pool_broken(e)
+                    organize_in_threads(batch_entries)
+                    continue
+                self._organize_dated_batch(executor, batch_entries, file_dates)
+
+        for entry in entries:
+            file_date = None
+            if self._date_cache is not None:
+                try:
+                    file_date = self._get_cached_date(entry.stat())
+                except OSError as e:
+                    logger.error("Error organizing file %s: %s", entry.path, e)
+                    continue
+            if file_date:
+                executor.submit(self.organize_file, entry.path, entry, file_date)
+                continue
+
+            batch.append(entry)
+            if len(batch) < DATE_BATCH_SIZE:
+                continue
+            submit_batch(batch)
+            batch = []
+            if len(pending) >= max_pending:
+                finish_pending(FIRST_COMPLETED)
+
+        if batch:
+            submit_batch(batch)
+        if pending:
+            finish_pending(ALL_COMPLETED)
 
     def process_directory(self, directory):
         """
         Process all files in a directory recursively.
+        File dates are extracted in a process pool when more than one worker
+        process is configured; files are then placed by the thread pool.
         """
-        logger.info(f"Processing directory: {directory}")
-        for root, _, files in os.walk(directory):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                self.organize_file(file_path)
+        logger.info("Processing directory: %s", directory)
+        entries = parallel_scandir(directory, self._all_exts)
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                if self.processes > 1:
+                    with ProcessPoolExecutor(max_workers=self.processes,
+                                             mp_context=_process_pool_context()) as process_executor:
+                        self._process_entries_with_pool(entries, executor, process_executor)
+                else:
+                    # Consume the results so any unexpected exception is raised here
+                    for _ in executor.map(lambda entry: self.organize_file(entry.path, entry), entries):
+                        pass
+        finally:
+            self.commit_date_cache()
+            with self._dirs_lock:
+                self._known_dirs.clear()
+                self._dir_contents.clear()
 
 class MediaFileHandler(FileSystemEventHandler):
+    # Time to wait for the rest of a burst of events before handling it
+    DEBOUNCE_SECONDS = 0.5
+    # Files modified more recently than this are assumed to still be written
+    SETTLE_SECONDS = 2
+
     def __init__(self, organizer):
         self.organizer = organizer
+        self._queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=organizer.workers)
+        self._consumer = threading.Thread(target=self._consume, name='media-file-consumer',
+                                          daemon=True)
+        self._consumer.start()
         
     def on_created(self, event):
-        if not event.is_directory:
-            logger.debug(f"File created: {event.src_path}")
-            self.organizer.organize_file(event.src_path)
+        if not event.is_directory and self.organizer.is_supported(event.src_path):
+            logger.debug("File created: %s", event.src_path)
+            self._queue.put(event.src_path)
             
     def on_moved(self, event):
-        if not event.is_directory:
-            logger.debug(f"File moved: {event.dest_path}")
-            self.organizer.organize_file(event.dest_path)
+        if not event.is_directory and self.organizer.is_supported(event.dest_path):
+            logger.debug("File moved: %s", event.dest_path)
+            self._queue.put(event.dest_path)
+
+    def stop(self):
+        """
+        Handle the files still queued and wait for them to be organized.
+        """
+        self._queue.put(None)
+        self._consumer.join()
+        self._executor.shutdown(wait=True)
+
+    def _consume(self):
+        """
+        Collect queued files in batches and dispatch them to the thread pool.
+        Files that are still being written are put back on the queue, or
+        left for the next startup scan when stopping.
+        """
+        while True:
+            file_paths = [self._queue.get()]
+            time.sleep(self.DEBOUNCE_SECONDS)
+            while True:
+                try:
+                    file_paths.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stopping = None in file_paths
+            # Drop duplicate events and group the batch by directory
+            batch = sorted(dict.fromkeys(path for path in file_paths if path is not None),
+                           key=os.path.dirname)
+            now = time.time()
+            futures = []
+            for file_path in batch:
+                try:
+                    file_mtime = os.stat(file_path).st_mtime
+                except OSError:
+                    logger.debug("File no longer exists: %s", file_path)
+                    continue
+                if 0 <= now - file_mtime < self.SETTLE_SECONDS:
+                    if stopping:
+                        # Never copy a partial file; the startup scan of the
+                        # next run organizes it
+                        logger.debug("Skipping file still being written: %s", file_path)
+                    else:
+                        # Still being written, check it again with the next batch
+                        self._queue.put(file_path)
+                    continue
+                futures.append(self._executor.submit(self.organizer.organize_file, file_path))
+
+            # Commit the dates cached for this batch, as the service normally
+            # runs until it is killed
+            wait(futures)
+            self.organizer.commit_date_cache()
+
+            if stopping:
+                return
+
+def _non_negative_int(value):
+    """
+    argparse type for counts that must not be negative.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(description='Photo Organizer')
@@ -158,6 +1022,20 @@ def main():
                         help='Perform a dry run without copying files')
     parser.add_argument('--scan-existing', action='store_true', 
                         help='Scan existing files in watch directories on startup')
+    parser.add_argument('--workers', type=_non_negative_int, default=None,
+                        help='Number of worker threads used to process files '
+                             '(default: min(32, 4 x available CPUs))')
+    parser.add_argument('--processes', type=_non_negative_int, default=None,
+                        help='Number of worker processes used to extract file dates '
+                             'when scanning existing files, 0 or 1 to extract them in '
+                             'the worker threads (default: number of available CPUs, '
+                             'at most 4)')
+    parser.add_argument('--link-mode', choices=['copy', 'hardlink', 'reflink', 'auto'],
+                        default='copy',
+                        help='How files are placed in the output directory: copy them, '
+                             'hardlink or reflink them when on the same filesystem, '
+                             'or auto to try a hardlink, then a reflink, then a copy '
+                             '(default: copy)')
     args = parser.parse_args()
     
     # Load configuration
@@ -165,7 +1043,7 @@ def main():
         with open(args.config, 'r') as f:
             config = json.load(f)
     except Exception as e:
-        logger.error(f"Error loading configuration: {e}")
+        logger.error("Error loading configuration: %s", e)
         return
     
     watch_paths = config.get('watch_paths', [])
@@ -176,7 +1054,8 @@ def main():
         return
     
     # Create organizer
-    organizer = PhotoOrganizer(watch_paths, output_path, args.dry_run)
+    organizer = PhotoOrganizer(watch_paths, output_path, args.dry_run, args.workers,
+                               args.link_mode, args.processes)
     
     # Process existing files if requested
     if args.scan_existing:
@@ -193,7 +1072,10 @@ def main():
         observer.schedule(event_handler, path, recursive=True)
         observer.start()
         observers.append(observer)
-        logger.info(f"Started watching directory: {path}")
+        logger.info("Started watching directory: %s", path)
+    
+    # Shut down cleanly on `docker stop`, which sends SIGTERM
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
     
     try:
         logger.info("Photo Organizer is running. Press Ctrl+C to stop.")
@@ -206,6 +1088,8 @@ def main():
     
     for observer in observers:
         observer.join()
+    event_handler.stop()
+    organizer.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file